@@ -0,0 +1,41 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional compiled version of the RetryPolicy.delays() loop.
+
+Built by setup.py when Cython and a C compiler are available; backoff.py
+falls back to pure Python otherwise. Output is bit-identical to the Python
+path: same arithmetic order, same rand() call sequence.
+"""
+
+
+cpdef tuple compute_delays_typed(
+    long n, double base, double factor, double cap, int mode, object rand, double cur, double prev
+):
+    """
+    The next n delays for a validated policy; mode as in backoff._JITTER_MODES.
+
+    rand is the policy RNG's bound random.Random.random. cur (next un-jittered
+    delay) and prev (last decorrelated sleep) carry the sequence across calls;
+    both start at base. Returns (delays, cur, prev).
+    """
+    cdef list out = []
+    cdef long i
+    cdef double d, half
+    for i in range(n):
+        if cur < cap:
+            d = cur
+            cur *= factor
+        else:
+            d = cap
+        if mode == 1:
+            d = <double>rand() * d
+        elif mode == 2:
+            half = d / 2.0
+            d = half + <double>rand() * half
+        elif mode == 3:
+            d = base + (prev * 3.0 - base) * <double>rand()
+            if not d < cap:
+                d = cap
+            prev = d
+        out.append(d)
+    return out, cur, prev
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+try:
+    import numba
+    import numpy as np
+except ImportError:  # optional: pip install -e ".[fast]"
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+
+def _decorrelated_delays(base: float, cap: float, u: "np.ndarray") -> "np.ndarray":
+    """
+    Decorrelated-jitter delays, one per uniform draw in u, in one compiled loop.
+
+    Only this mode gets a kernel: it is a recurrence (no vector form), while the
+    other modes are already vectorized in NumPy. The float ops are the same, in
+    the same order, as the Python loop in RetryPolicy.delays_array() (no fastmath),
+    so seeded output is bit-identical with or without numba.
+    """
+    out = np.empty(u.size)
+    prev = base
+    for i in range(u.size):
+        d = base + (prev * 3.0 - base) * u[i]
+        prev = d if d < cap else cap
+        out[i] = prev
+    return out
+
+
+# cache=True keeps the compiled kernel on disk, so only the first process pays the compile.
+decorrelated_delays = numba.njit(cache=True)(_decorrelated_delays) if HAVE_NUMBA else None
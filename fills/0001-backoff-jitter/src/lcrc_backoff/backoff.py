@@ -1,13 +1,30 @@
 from __future__ import annotations
 
+import itertools
+import math
 import random
 from dataclasses import dataclass
-from typing import Callable, Iterator, Optional
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
 
+try:
+    from ._backoff import compute_delays_typed
+except ImportError:  # optional C extension, see setup.py
+    compute_delays_typed = None
 
-def capped_exponential(attempt: int, base: float, factor: float, cap: float) -> float:
-    if attempt < 0:
-        raise ValueError("attempt must be >= 0")
+if TYPE_CHECKING:
+    import numpy as np
+
+# Below this many attempts the Python decorrelated loop wins: JIT dispatch overhead is not amortized.
+_JIT_MIN_ATTEMPTS = 1024
+
+# Uniforms drawn per list comprehension in delays()' saturated tail.
+_RAND_CHUNK = 256
+
+# Delays per compute_delays_typed() call: keeps delays() lazy (bounded work before the first yield).
+_KERNEL_CHUNK = 256
+
+
+def _validate(base: float, factor: float, cap: float) -> None:
     if base <= 0:
         raise ValueError("base must be > 0")
     if factor < 1:
@@ -15,22 +32,42 @@ def capped_exponential(attempt: int, base: float, factor: float, cap: float) ->
     if cap <= 0:
         raise ValueError("cap must be > 0")
 
-    raw = base * (factor ** attempt)
-    return min(cap, raw)
+
+def capped_exponential(attempt: int, base: float, factor: float, cap: float) -> float:
+    if attempt < 0:
+        raise ValueError("attempt must be >= 0")
+    _validate(base, factor, cap)
+
+    if factor == 2.0:
+        raw = math.ldexp(base, attempt)  # exact base * 2**attempt, no pow()
+    else:
+        raw = base * (factor ** attempt)
+    # conditional, not min(): no builtin lookup + call; equal to min(cap, raw) for any raw
+    return raw if raw < cap else cap
 
 
-def jitter_full(delay: float, rng: random.Random) -> float:
+def jitter_full(delay: float, rand: Callable[[], float]) -> float:
     # Full jitter: uniform between 0 and delay
     if delay < 0:
         raise ValueError("delay must be >= 0")    
-    return rng.uniform(0.0, delay)
+    # same value as rng.uniform(0.0, delay), minus the Python-level uniform() frame
+    return rand() * delay
 
 
-def jitter_equal(delay: float, rng: random.Random) -> float:
+def jitter_equal(delay: float, rand: Callable[[], float]) -> float:
     # Equal jitter: half deterministic, half random
     if delay < 0:
         raise ValueError("delay must be >= 0")    
-    return delay / 2.0 + rng.uniform(0.0, delay / 2.0)
+    half = delay / 2.0
+    return half + rand() * half
+
+
+def jitter_decorrelated(prev_sleep: float, base: float, cap: float, rand: Callable[[], float]) -> float:
+    # Decorrelated jitter: uniform between base and 3x the previous sleep, capped
+    if prev_sleep < 0:
+        raise ValueError("prev_sleep must be >= 0")
+    d = base + (prev_sleep * 3.0 - base) * rand()
+    return d if d < cap else cap
 
 
 def compute_delay(
@@ -41,6 +78,7 @@ def compute_delay(
     cap: float = 30.0,
     jitter: str = "full",
     rng: Optional[random.Random] = None,
+    prev_sleep: Optional[float] = None,
 ) -> float:
     """
     Compute retry delay for a given attempt (0-based).
@@ -49,22 +87,69 @@ def compute_delay(
       - "none": no jitter (deterministic)
       - "full": full jitter
       - "equal": equal jitter
+      - "decorrelated": min(cap, uniform(base, prev_sleep * 3)); depends on the
+        previous delay (prev_sleep, default: base) rather than on attempt/factor
+
+    rng: source of randomness (default: the shared module-level random generator)
     """
-    rng = rng or random.Random()
+    # the module-level generator, not a fresh random.Random() (urandom seeding) per call
+    rand = random.random if rng is None else rng.random
+    jitter = _canonical_jitter(jitter)
+    if jitter == "decorrelated":
+        # independent of attempt: no capped_exponential() (which overflows for large attempts)
+        if attempt < 0:
+            raise ValueError("attempt must be >= 0")
+        _validate(base, factor, cap)
+        return jitter_decorrelated(base if prev_sleep is None else prev_sleep, base, cap, rand)
     d = capped_exponential(attempt, base, factor, cap)
+    fn = _JITTER_FUNCS[jitter]
+    return d if fn is None else fn(d, rand)
+
+
+# delay -> jittered delay; "decorrelated" also needs the previous sleep (see compute_delay)
+_JITTER_FUNCS = {"none": None, "full": jitter_full, "equal": jitter_equal}
+
+# canonical names -> int modes, as taken by the compiled kernel (_backoff)
+_JITTER_MODES = {"none": 0, "full": 1, "equal": 2, "decorrelated": 3}
 
-    jitter = jitter.lower().strip()
+
+def _canonical_jitter(jitter: str) -> str:
+    # Canonical names are one dict hit; only other spellings pay for lower()/strip().
+    if jitter in _JITTER_MODES:
+        return jitter
+    name = jitter.lower().strip()
+    if name in _JITTER_MODES:
+        return name
+    raise ValueError(f"unknown jitter mode: {name!r}")
+
+
+def _jitter_fn(jitter: str, rand: Callable[[], float], base: float, cap: float) -> Callable[[float], float]:
+    # Resolve the jitter mode once; the returned closure is the per-attempt hot path.
+    jitter = _canonical_jitter(jitter)
     if jitter == "none":
-        return d
+        return lambda d: d
     if jitter == "full":
-        return jitter_full(d, rng)
+        return lambda d: rand() * d
     if jitter == "equal":
-        return jitter_equal(d, rng)
+        def _equal(d: float) -> float:
+            half = d / 2.0
+            return half + rand() * half
+
+        return _equal
+
+    # "decorrelated": the closure carries the previous sleep across attempts
+    prev = base
 
-    raise ValueError(f"unknown jitter mode: {jitter!r}")
+    def _decorrelated(_d: float) -> float:
+        nonlocal prev
+        d = base + (prev * 3.0 - base) * rand()
+        prev = d if d < cap else cap
+        return prev
 
+    return _decorrelated
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RetryPolicy:
     max_attempts: int = 5
     base: float = 0.5
@@ -74,18 +159,109 @@ class RetryPolicy:
     seed: Optional[int] = None
 
     def delays(self) -> Iterator[float]:
+        # locals, not self.<field> lookups, inside the loops
+        max_attempts, base, factor, cap = self.max_attempts, self.base, self.factor, self.cap
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be > 0")
+        _validate(base, factor, cap)
+        rand = random.Random(self.seed).random
+        if compute_delays_typed is not None:
+            mode = _JITTER_MODES[_canonical_jitter(self.jitter)]
+            cur = prev = base
+            remaining = max_attempts
+            while remaining > 0:
+                k = _KERNEL_CHUNK if remaining > _KERNEL_CHUNK else remaining
+                remaining -= k
+                chunk, cur, prev = compute_delays_typed(k, base, factor, cap, mode, rand, cur, prev)
+                yield from chunk
+            return
+
+        jitter = _canonical_jitter(self.jitter)
+        apply = _jitter_fn(jitter, rand, base, cap)
+        # Ramp: running product instead of factor ** attempt, until the cap is hit.
+        attempt = 0
+        cur = base
+        while attempt < max_attempts and cur < cap:
+            yield apply(cur)
+            cur *= factor
+            attempt += 1
+
+        # Saturated tail: every remaining delay is the cap. Each chunk is one list
+        # comprehension (draws in order, so the stream is unchanged) instead of a
+        # closure call per attempt; the RNG is private, so drawing ahead is harmless.
+        remaining = max_attempts - attempt
+        if jitter == "none":
+            yield from itertools.repeat(cap, remaining)
+        elif jitter == "decorrelated":
+            # each delay depends on the previous one (kept in the closure); chunking measured slower
+            for _ in range(remaining):
+                yield apply(cap)
+        else:
+            half = cap / 2.0
+            while remaining > 0:
+                k = _RAND_CHUNK if remaining > _RAND_CHUNK else remaining
+                remaining -= k
+                if jitter == "full":
+                    yield from [rand() * cap for _ in range(k)]
+                else:
+                    yield from [half + rand() * half for _ in range(k)]
+
+    def delays_array(self) -> "np.ndarray":
+        """
+        All delays at once as a float64 NumPy array (requires numpy).
+
+        Vectorized alternative to delays() for large max_attempts; with numba
+        installed, long decorrelated policies run through a compiled kernel
+        (same output, see _fast).
+        Seeded output is reproducible, but it comes from numpy's default_rng,
+        so it is NOT bit-identical to delays() (which uses random.Random).
+        """
+        try:
+            import numpy as np
+        except ImportError:  # optional: pip install -e ".[fast]"
+            raise ImportError('delays_array() requires numpy (pip install -e ".[fast]")') from None
+        # numpy is imported here, not at module level, to keep it off the CLI start-up path
+
         if self.max_attempts <= 0:
             raise ValueError("max_attempts must be > 0")
-        rng = random.Random(self.seed)
-        for attempt in range(self.max_attempts):
-            yield compute_delay(
-                attempt,
-                base=self.base,
-                factor=self.factor,
-                cap=self.cap,
-                jitter=self.jitter,
-                rng=rng,
-            )
+        _validate(self.base, self.factor, self.cap)
+        mode = _JITTER_MODES[_canonical_jitter(self.jitter)]
+
+        # One bulk draw of all uniforms (PCG64) instead of a per-attempt call; both
+        # paths below consume exactly this stream.
+        n = self.max_attempts
+        u = np.random.default_rng(self.seed).random(n) if mode else np.empty(0)
+
+        if mode == 3:
+            # decorrelated: each delay depends on the previous one, so no vector form
+            if n >= _JIT_MIN_ATTEMPTS:
+                from . import _fast  # imports numba, so only where its kernel can be used
+
+                if _fast.HAVE_NUMBA:
+                    return _fast.decorrelated_delays(self.base, self.cap, u)
+            out = np.empty(n)
+            prev, base, cap = self.base, self.base, self.cap
+            for i, x in enumerate(u.tolist()):
+                d = base + (prev * 3.0 - base) * x
+                prev = d if d < cap else cap
+                out[i] = prev
+            return out
+
+        # Two streaming passes over preallocated arrays: (1) capped exponentials in raw,
+        # (2) combine with u in place. No temporaries; same arithmetic as the fused forms.
+        raw = np.arange(n, dtype=np.float64)
+        with np.errstate(over="ignore"):  # factor**attempt -> inf is capped below
+            np.power(self.factor, raw, out=raw)
+        np.multiply(raw, self.base, out=raw)
+        np.minimum(raw, self.cap, out=raw)
+
+        if mode == 0:
+            return raw
+        if mode == 1:
+            return np.multiply(u, raw, out=u)
+        np.multiply(raw, 0.5, out=raw)  # == raw / 2.0 exactly
+        np.multiply(u, raw, out=u)
+        return np.add(raw, u, out=u)
 
 
 def retry(
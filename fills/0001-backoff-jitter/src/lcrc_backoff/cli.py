@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import argparse
-import json
-from dataclasses import asdict
+import sys
 
 from .backoff import RetryPolicy
 
@@ -13,12 +12,29 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--base", type=float, default=0.5)
     p.add_argument("--factor", type=float, default=2.0)
     p.add_argument("--cap", type=float, default=30.0)
-    p.add_argument("--jitter", type=str, default="full", choices=["none", "full", "equal"])
+    p.add_argument("--jitter", type=str, default="full", choices=["none", "full", "equal", "decorrelated"])
     p.add_argument("--seed", type=int, default=None)
     p.add_argument("--json", action="store_true", help="Output JSON")
+    p.add_argument("--compact", action="store_true", help="With --json: single-line output")
     return p
 
 
+def _dump_json(obj, pretty: bool) -> bytes:
+    """Policy + delays as JSON bytes; --compact uses orjson if installed, unless an int (e.g. --seed) overflows it."""
+    if not pretty:
+        try:
+            import orjson
+
+            return orjson.dumps(obj)
+        except (ImportError, TypeError):
+            pass
+    import json
+
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
 def main() -> None:
     args = build_parser().parse_args()
     try:
@@ -32,21 +48,22 @@ def main() -> None:
         )
         delays = list(policy.delays())
     except ValueError as e:
-        raise SystemExit(f"error: {e}") from e    
-
-    policy = RetryPolicy(
-        max_attempts=args.max_attempts,
-        base=args.base,
-        factor=args.factor,
-        cap=args.cap,
-        jitter=args.jitter,
-        seed=args.seed,
-    )
-    delays = list(policy.delays())
+        raise SystemExit(f"error: {e}") from e
 
     if args.json:
-        payload = {"policy": asdict(policy), "delays": delays}
-        print(json.dumps(payload, indent=2))
+        # explicit fields (same keys/order as asdict(policy)) skip asdict's recursive deepcopy walk
+        payload = {
+            "policy": {
+                "max_attempts": policy.max_attempts,
+                "base": policy.base,
+                "factor": policy.factor,
+                "cap": policy.cap,
+                "jitter": policy.jitter,
+                "seed": policy.seed,
+            },
+            "delays": delays,
+        }
+        sys.stdout.buffer.write(_dump_json(payload, pretty=not args.compact) + b"\n")
     else:
         for i, d in enumerate(delays):
             print(f"attempt={i} delay={d:.3f}s")
@@ -1,8 +1,18 @@
-import unittest
+import itertools
 import random
+import subprocess
+import sys
+import unittest
+from unittest import mock
 
+from lcrc_backoff import _fast, backoff
 from lcrc_backoff.backoff import capped_exponential, compute_delay, RetryPolicy
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestBackoff(unittest.TestCase):
     def test_capped_exponential_grows_and_caps(self):
@@ -28,11 +38,62 @@ class TestBackoff(unittest.TestCase):
         self.assertGreaterEqual(d, 8.0)
         self.assertLessEqual(d, 16.0)
 
+    def test_default_rng_is_module_random(self):
+        state = random.getstate()
+        try:
+            random.seed(7)
+            got = [compute_delay(i, jitter="full") for i in range(5)]
+        finally:
+            random.setstate(state)
+        rng = random.Random(7)
+        self.assertEqual(got, [compute_delay(i, jitter="full", rng=rng) for i in range(5)])
+
+    def test_decorrelated_jitter_threads_previous_sleep(self):
+        p = RetryPolicy(max_attempts=20, base=1.0, cap=30.0, jitter="decorrelated", seed=5)
+        got = list(p.delays())
+
+        rng = random.Random(5)
+        prev = None
+        for attempt, d in enumerate(got):
+            expected = compute_delay(attempt, base=1.0, cap=30.0, jitter="decorrelated", rng=rng, prev_sleep=prev)
+            self.assertEqual(d, expected)
+            self.assertGreaterEqual(d, 1.0)
+            self.assertLessEqual(d, 30.0 if prev is None else min(30.0, prev * 3.0))
+            prev = d
+
+    def test_decorrelated_ignores_attempt(self):
+        # base * factor**2000 overflows a float; decorrelated never computes it
+        for attempt in (0, 2000):
+            d = compute_delay(attempt, jitter="decorrelated", rng=random.Random(1), prev_sleep=1.0)
+            self.assertEqual(d, compute_delay(0, jitter="decorrelated", rng=random.Random(1), prev_sleep=1.0))
+        self.assertRaises(ValueError, compute_delay, -1, jitter="decorrelated")
+
     def test_policy_reproducible_with_seed(self):
         p1 = RetryPolicy(max_attempts=5, seed=42, jitter="full")
         p2 = RetryPolicy(max_attempts=5, seed=42, jitter="full")
         self.assertEqual(list(p1.delays()), list(p2.delays()))
 
+    def test_policy_long_tail_saturates_at_cap(self):
+        d = list(RetryPolicy(max_attempts=5000, base=1.0, factor=2.0, cap=10.0, jitter="none").delays())
+        self.assertEqual(d[:5], [1.0, 2.0, 4.0, 8.0, 10.0])
+        self.assertEqual(set(d[4:]), {10.0})
+
+    def test_chunked_tail_keeps_one_draw_per_attempt(self):
+        n = 3 * backoff._RAND_CHUNK + 7  # ragged last chunk
+        for jitter in ("full", "equal"):
+            with self.subTest(jitter=jitter), mock.patch.object(backoff, "compute_delays_typed", None):
+                got = list(RetryPolicy(max_attempts=n, base=1.0, cap=10.0, jitter=jitter, seed=9).delays())
+                rng = random.Random(9)
+                expected = [compute_delay(i, base=1.0, cap=10.0, jitter=jitter, rng=rng) for i in range(n)]
+                self.assertEqual(got, expected)
+
+    def test_delays_is_lazy(self):
+        # retry() stops at the first success: delays() must not build all max_attempts up front
+        for jitter in ("none", "full", "equal", "decorrelated"):
+            with self.subTest(jitter=jitter):
+                it = RetryPolicy(max_attempts=10**12, jitter=jitter, seed=1).delays()
+                self.assertLessEqual(next(it), 1.5)
+
     def test_invalid_inputs(self):
         with self.assertRaises(ValueError):
             capped_exponential(-1, 1.0, 2.0, 10.0)
@@ -47,6 +108,62 @@ class TestBackoff(unittest.TestCase):
         with self.assertRaises(ValueError):
             compute_delay(0, jitter="banana")
 
+    @unittest.skipIf(backoff.compute_delays_typed is None, "C extension not built")
+    def test_compiled_delays_match_python(self):
+        for jitter in ("none", "full", "equal", "decorrelated"):
+            with self.subTest(jitter=jitter):
+                # ramp spans several kernel chunks, then a ragged last chunk
+                n = 3 * backoff._KERNEL_CHUNK + 13
+                p = RetryPolicy(max_attempts=n, base=0.1, factor=1.01, cap=60.0, jitter=jitter, seed=3)
+                compiled = list(p.delays())
+                with mock.patch.object(backoff, "compute_delays_typed", None):
+                    self.assertEqual(compiled, list(p.delays()))
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_delays_array_matches_bounds_and_seed(self):
+        none = RetryPolicy(max_attempts=8, base=1.0, cap=10.0, jitter="none")
+        self.assertEqual(none.delays_array().tolist(), list(none.delays()))
+
+        raw = RetryPolicy(max_attempts=2000, base=1.0, cap=10.0, jitter="none").delays_array()
+        p = RetryPolicy(max_attempts=2000, base=1.0, cap=10.0, jitter="equal", seed=7)
+        arr = p.delays_array()
+        self.assertEqual(arr.shape, (2000,))
+        self.assertTrue(np.all(arr >= raw / 2.0))
+        self.assertTrue(np.all(arr <= raw))
+        self.assertTrue(np.array_equal(arr, p.delays_array()))
+
+        dec = RetryPolicy(max_attempts=200, base=1.0, cap=10.0, jitter="decorrelated", seed=7).delays_array()
+        self.assertTrue(np.all((dec >= 1.0) & (dec <= 10.0)))
+        self.assertTrue(np.all(dec[1:] <= dec[:-1] * 3.0))
+
+    @unittest.skipUnless(_fast.HAVE_NUMBA, "numba not installed")
+    def test_jit_kernel_matches_numpy_path(self):
+        # exact equality: seeded output must not depend on whether numba is installed
+        for jitter, (base, cap) in itertools.product(
+            ("none", "full", "equal", "decorrelated"), ((0.1, 60.0), (1.0, 1.0), (0.37, 1e6))
+        ):
+            with self.subTest(jitter=jitter, base=base, cap=cap):
+                p = RetryPolicy(max_attempts=3000, base=base, factor=1.1, cap=cap, jitter=jitter, seed=3)
+                jit = p.delays_array()
+                with mock.patch.object(backoff, "_JIT_MIN_ATTEMPTS", 10**9):
+                    ref = p.delays_array()
+                self.assertTrue(np.array_equal(jit, ref))
+
+    @unittest.skipUnless(np is not None, "numpy not installed")
+    def test_delays_array_imports_numba_only_for_long_decorrelated(self):
+        # fresh interpreter: this module has already imported _fast
+        code = (
+            "import sys\n"
+            "from lcrc_backoff.backoff import RetryPolicy\n"
+            "for j in ('none', 'full', 'equal'):\n"
+            "    RetryPolicy(max_attempts=5000, jitter=j).delays_array()\n"
+            "RetryPolicy(max_attempts=10, jitter='decorrelated').delays_array()\n"
+            "print('lcrc_backoff._fast' in sys.modules)\n"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(out.strip(), "False")
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -1,5 +1,9 @@
+import json
+import sys
 import unittest
-from lcrc_backoff.cli import build_parser
+from unittest import mock
+
+from lcrc_backoff.cli import _dump_json, build_parser
 from lcrc_backoff.backoff import RetryPolicy
 
 class TestCLI(unittest.TestCase):
@@ -15,3 +19,13 @@ class TestCLI(unittest.TestCase):
             seed=args.seed,
         )
         self.assertEqual(policy.max_attempts, 6)
+
+    def test_dump_json_pretty_and_compact(self):
+        obj = {"a": [1, 2.5, None], "b": {"c": True}}
+        # None in sys.modules makes `import orjson` fail: exercises the stdlib fallback too
+        for mods in ({}, {"orjson": None}):
+            with self.subTest(orjson=not mods), mock.patch.dict(sys.modules, mods):
+                self.assertEqual(_dump_json(obj, pretty=True), json.dumps(obj, indent=2).encode())
+                self.assertEqual(_dump_json(obj, pretty=False), b'{"a":[1,2.5,null],"b":{"c":true}}')
+                # beyond orjson's 64-bit ints (e.g. a huge --seed): stdlib fallback, no TypeError
+                self.assertEqual(_dump_json({"seed": 2**70}, pretty=False), b'{"seed":1180591620717411303424}')
@@ -0,0 +1,38 @@
+"""
+Optional Cython accelerators. Metadata lives in pyproject.toml.
+
+If Cython or a C compiler is missing, the extensions are skipped and the
+package installs as pure Python.
+"""
+import sys
+
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+
+
+class optional_build_ext(build_ext):
+    def run(self):
+        try:
+            super().run()
+        except Exception as e:  # noqa: BLE001 (no compiler: stay pure Python)
+            print(f"warning: skipping optional C extensions: {e}", file=sys.stderr)
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as e:  # noqa: BLE001
+            print(f"warning: skipping optional C extension {ext.name}: {e}", file=sys.stderr)
+
+
+def _extensions():
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    # no FMA contraction: results must match the pure-Python path bit for bit
+    args = [] if sys.platform == "win32" else ["-ffp-contract=off"]
+    ext = Extension("lcrc_ratelimit._limiter", ["src/lcrc_ratelimit/_limiter.pyx"], extra_compile_args=args)
+    return cythonize([ext], language_level=3)
+
+
+setup(ext_modules=_extensions(), cmdclass={"build_ext": optional_build_ext})
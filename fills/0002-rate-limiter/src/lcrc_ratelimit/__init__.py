@@ -1,2 +1,11 @@
-__all__ = ["TokenBucket"]
-from .limiter import TokenBucket
\ No newline at end of file
+__all__ = ["BucketPool", "TokenBucket"]
+from .limiter import TokenBucket
+
+
+def __getattr__(name: str):
+    # BucketPool pulls in numpy; resolve it on first access so the CLI does not pay for it
+    if name == "BucketPool":
+        from .pool import BucketPool
+
+        return BucketPool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
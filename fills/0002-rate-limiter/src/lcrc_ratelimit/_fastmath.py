@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import functools
+import importlib.util
+from typing import Callable, Tuple
+
+# optional: pip install -e ".[fast]"; only imported once a jit=True bucket needs it
+HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
+
+def _refill_and_take(
+    tokens: float,
+    last_ts: float,
+    now: float,
+    rate: float,
+    capacity: float,
+    cost: float,
+) -> Tuple[float, float, bool]:
+    """
+    Refill + consume in one step: (tokens, last_ts, allowed) in, out.
+
+    Same semantics as TokenBucket._refill() followed by the allow() check:
+    backward time is treated as no time elapsed. Timestamps are in clock
+    units and rate is tokens per clock unit.
+    """
+    elapsed = now - last_ts
+    if elapsed > 0.0:
+        tokens = min(capacity, tokens + elapsed * rate)
+        last_ts = now
+    if tokens >= cost:
+        return tokens - cost, last_ts, True
+    return tokens, last_ts, False
+
+
+try:
+    from ._limiter import refill_and_take as compiled_refill_and_take
+except ImportError:  # optional C extension, see setup.py
+    compiled_refill_and_take = None
+
+
+@functools.lru_cache(maxsize=None)
+def jit_refill_and_take() -> Callable[..., Tuple[float, float, bool]]:
+    """numba-compiled _refill_and_take; numba is slow to import, so that happens on first use."""
+    import numba
+
+    # No fastmath: FMA contraction would round differently from the pure-Python path.
+    # cache=True keeps the compiled kernel on disk, so only the first process pays the compile.
+    return numba.njit(cache=True)(_refill_and_take)
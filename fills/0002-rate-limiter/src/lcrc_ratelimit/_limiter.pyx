@@ -0,0 +1,25 @@
+# cython: language_level=3
+"""
+Optional compiled version of the token-bucket refill + consume step.
+
+Built by setup.py when Cython and a C compiler are available; _fastmath.py
+falls back to pure Python otherwise.
+"""
+
+
+cpdef tuple refill_and_take(double tokens, object last_ts, object now, double rate, double capacity, double cost):
+    """
+    Same contract as _fastmath._refill_and_take.
+
+    Timestamps stay Python objects so integer-nanosecond clocks keep exact
+    int timestamps; everything else is C doubles.
+    """
+    cdef double elapsed = now - last_ts
+    if elapsed > 0.0:
+        tokens = tokens + elapsed * rate
+        if not tokens < capacity:
+            tokens = capacity
+        last_ts = now
+    if tokens >= cost:
+        return tokens - cost, last_ts, True
+    return tokens, last_ts, False
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import argparse
-import json
-from dataclasses import asdict
+import sys
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, List, Optional
 
 from .limiter import TokenBucket
 
+if TYPE_CHECKING:
+    import argparse
+
 
 class SimClock:
     def __init__(self, start: float = 0.0) -> None:
@@ -19,6 +22,8 @@ class SimClock:
 
 
 def build_parser() -> argparse.ArgumentParser:
+    import argparse
+
     p = argparse.ArgumentParser(prog="lcrc-ratelimit", description="LCRC Fill 0002: Token Bucket Rate Limiter")
     sub = p.add_subparsers(dest="cmd", required=True)
 
@@ -27,6 +32,7 @@ def build_parser() -> argparse.ArgumentParser:
     common.add_argument("--capacity", type=float, required=True, help="max tokens (burst)")
     common.add_argument("--cost", type=float, default=1.0, help="tokens per request")
     common.add_argument("--json", action="store_true", help="output JSON")
+    common.add_argument("--compact", action="store_true", help="with --json: single-line output")
 
     p_check = sub.add_parser("check", parents=[common], help="single allow() check")
     p_check.add_argument("--start-full", action="store_true", default=True)
@@ -40,6 +46,22 @@ def build_parser() -> argparse.ArgumentParser:
     return p
 
 
+def _dump_json(obj, pretty: bool) -> bytes:
+    """Bucket state / simulation results as JSON bytes: orjson for --compact when installed and able, else stdlib."""
+    if not pretty:
+        try:
+            import orjson
+
+            return orjson.dumps(obj)
+        except (ImportError, TypeError):
+            pass
+    import json
+
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
 def cmd_check(args: argparse.Namespace) -> int:
     clock = SimClock()
     bucket = TokenBucket(rate=args.rate, capacity=args.capacity, clock=clock.now, start_full=args.start_full)
@@ -47,7 +69,10 @@ def cmd_check(args: argparse.Namespace) -> int:
     snap = bucket.snapshot()
 
     if args.json:
-        print(json.dumps({"allowed": allowed, "bucket": asdict(snap)}, indent=2))
+        # same keys as asdict(snap), built directly
+        bucket_json = {"rate": snap.rate, "capacity": snap.capacity, "tokens": snap.tokens, "last_ts": snap.last_ts}
+        payload = {"allowed": allowed, "bucket": bucket_json}
+        sys.stdout.buffer.write(_dump_json(payload, pretty=not args.compact) + b"\n")
     else:
         print(f"allowed={allowed} tokens={snap.tokens:.6f}/{snap.capacity:.6f}")
     return 0
@@ -83,15 +108,45 @@ def cmd_simulate(args: argparse.Namespace) -> int:
             },
             "results": results,
         }
-        print(json.dumps(payload, indent=2))
+        sys.stdout.buffer.write(_dump_json(payload, pretty=not args.compact) + b"\n")
     else:
         for r in results:
             print(f"t={r['t']:.3f} i={r['i']:02d} allowed={r['allowed']} tokens={r['tokens']:.3f}/{r['capacity']:.3f}")
     return 0
 
 
+_CHECK_FLOAT_OPTS = {"--rate": "rate", "--capacity": "capacity", "--cost": "cost"}
+_CHECK_BOOL_OPTS = {"--json": "json", "--compact": "compact", "--start-full": "start_full"}
+
+
+def _fast_check(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Hand-rolled parse of the common `check` invocation, skipping argparse import + setup.
+
+    Returns None for anything it does not fully understand (other commands, --help,
+    --opt=value, bad values, missing options), so argparse handles it and its errors.
+    """
+    if not argv or argv[0] != "check":
+        return None
+    args = SimpleNamespace(cmd="check", rate=None, capacity=None, cost=1.0, json=False, compact=False, start_full=True)
+    it = iter(argv[1:])
+    for opt in it:
+        if opt in _CHECK_BOOL_OPTS:
+            setattr(args, _CHECK_BOOL_OPTS[opt], True)
+        elif opt in _CHECK_FLOAT_OPTS:
+            try:
+                setattr(args, _CHECK_FLOAT_OPTS[opt], float(next(it)))
+            except (StopIteration, ValueError):
+                return None
+        else:
+            return None
+    if args.rate is None or args.capacity is None:
+        return None
+    return args
+
+
 def main() -> None:
-    args = build_parser().parse_args()
+    args = _fast_check(sys.argv[1:]) or build_parser().parse_args()
     if args.cmd == "check":
         raise SystemExit(cmd_check(args))
     if args.cmd == "simulate":
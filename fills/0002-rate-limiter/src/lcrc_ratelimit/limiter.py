@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
+
+from ._fastmath import HAVE_NUMBA, compiled_refill_and_take, jit_refill_and_take
 
 
 def _validate_positive(name: str, value: float) -> None:
@@ -9,12 +12,12 @@ def _validate_positive(name: str, value: float) -> None:
         raise ValueError(f"{name} must be > 0")
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenBucketSnapshot:
     rate: float
     capacity: float
     tokens: float
-    last_ts: float
+    last_ts: Union[float, int]  # clock units: float seconds, or int nanoseconds with clock_ns
 
 
 class TokenBucket:
@@ -25,7 +28,13 @@ class TokenBucket:
     - capacity: max tokens (burst size)
     - starts full (tokens = capacity)
 
-    clock: injectable for tests (default: time.monotonic)
+    clock: injectable for tests (default: time.monotonic_ns)
+    clock_ns: clock returns integer nanoseconds instead of float seconds
+        (implied for the default clock); timestamps then stay exact ints
+    monotonic_clock: clock never goes backwards (true for time.monotonic), so refill
+        can skip the timestamp coercion and clamp; False keeps the defensive path
+    jit: route allow() through the numba-compiled refill kernel (requires numba);
+        otherwise allow() uses the Cython kernel when the C extension is built
     """
 
     def __init__(
@@ -33,19 +42,34 @@ class TokenBucket:
         *,
         rate: float,
         capacity: float,
-        clock: Callable[[], float],
+        clock: Optional[Callable[[], float]] = None,
+        clock_ns: bool = False,
         start_full: bool = True,
+        monotonic_clock: bool = True,
+        jit: bool = False,
     ) -> None:
         _validate_positive("rate", float(rate))
         _validate_positive("capacity", float(capacity))
+        if jit and not HAVE_NUMBA:
+            raise ImportError('jit=True requires numba (pip install -e ".[fast]")')
 
         self._rate = float(rate)
         self._capacity = float(capacity)
+        if clock is None:
+            clock, clock_ns = time.monotonic_ns, True
         self._clock = clock
+        self._clock_ns = bool(clock_ns)
+        self._coerce = int if self._clock_ns else float
+        # tokens per clock tick, so refill is elapsed * rate whatever the clock unit
+        self._rate_tick = self._rate * 1e-9 if self._clock_ns else self._rate
+        self._kernel = jit_refill_and_take() if jit else compiled_refill_and_take
 
-        now = float(self._clock())
+        now = self._coerce(self._clock())
         self._last_ts = now
         self._tokens = self._capacity if start_full else 0.0
+        self._monotonic = bool(monotonic_clock)
+        if monotonic_clock:
+            self._refill = self._refill_fast
 
     @property
     def rate(self) -> float:
@@ -65,7 +89,7 @@ class TokenBucket:
         )
 
     def _refill(self, now: Optional[float] = None) -> None:
-        t = float(self._clock()) if now is None else float(now)
+        t = self._coerce(self._clock() if now is None else now)
         if t < self._last_ts:
             # clock moved backwards; clamp (monotonic should not do this, but tests might)
             t = self._last_ts
@@ -74,20 +98,47 @@ class TokenBucket:
         if elapsed <= 0:
             return
 
-        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        tokens = self._tokens + elapsed * self._rate_tick
+        self._tokens = tokens if tokens < self._capacity else self._capacity
         self._last_ts = t
 
+    def _refill_fast(self, now: Optional[float] = None) -> None:
+        t = self._clock() if now is None else now
+        elapsed = t - self._last_ts
+        # a non-positive delta is a no-op, which also covers a clock that does step back
+        if elapsed > 0:
+            tokens = self._tokens + elapsed * self._rate_tick
+            self._tokens = self._capacity if tokens > self._capacity else tokens
+            self._last_ts = t
+
     def allow(self, *, cost: float = 1.0, now: Optional[float] = None) -> bool:
         cost = float(cost)
         _validate_positive("cost", cost)
         if cost > self._capacity:
             raise ValueError("cost must be <= capacity")
 
-        self._refill(now)
-        if self._tokens >= cost:
-            self._tokens -= cost
-            return True
-        return False
+        if self._kernel is not None:
+            t = self._coerce(self._clock() if now is None else now)
+            self._tokens, self._last_ts, allowed = self._kernel(
+                self._tokens, self._last_ts, t, self._rate_tick, self._capacity, cost
+            )
+            return bool(allowed)
+
+        # refill + consume inlined: one store to _tokens, at most one to _last_ts
+        t = self._clock() if now is None else now
+        if not self._monotonic:
+            t = self._coerce(t)
+        tokens = self._tokens
+        elapsed = t - self._last_ts
+        # backward time is no time elapsed, and must not pull _last_ts back either
+        if elapsed > 0:
+            tokens += elapsed * self._rate_tick
+            if tokens > self._capacity:
+                tokens = self._capacity
+            self._last_ts = t
+        allowed = tokens >= cost
+        self._tokens = tokens - cost if allowed else tokens
+        return allowed
 
     def wait_time(self, *, cost: float = 1.0, now: Optional[float] = None) -> float:
         """
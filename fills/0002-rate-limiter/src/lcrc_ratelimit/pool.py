@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional, Union
+
+from .limiter import TokenBucketSnapshot
+
+try:
+    import numpy as np
+except ImportError:  # optional: pip install -e ".[fast]"
+    np = None
+
+
+class BucketPool:
+    """
+    Many token buckets stored as parallel NumPy arrays (requires numpy).
+
+    Bucket i is described by tokens[i], last_ts[i], rate[i], capacity[i].
+    allow_many() admits a whole batch of bucket ids in one vectorized pass
+    instead of one TokenBucket.allow() call per bucket, with the same
+    refill/cap/backward-clock semantics.
+
+    - n: number of buckets (ids 0..n-1)
+    - rate, capacity: scalar (shared by all buckets) or one value per bucket
+    - clock: injectable for tests (default: time.monotonic_ns)
+    - clock_ns: clock returns integer nanoseconds (implied for the default clock);
+      last_ts is then an int64 array, otherwise float64 seconds
+    """
+
+    def __init__(
+        self,
+        n: int,
+        *,
+        rate,
+        capacity,
+        clock: Optional[Callable[[], float]] = None,
+        clock_ns: bool = False,
+        start_full: bool = True,
+    ) -> None:
+        if np is None:
+            raise ImportError('BucketPool requires numpy (pip install -e ".[fast]")')
+        if n <= 0:
+            raise ValueError("n must be > 0")
+
+        self.rate = np.array(np.broadcast_to(np.asarray(rate, dtype=np.float64), (n,)))
+        self.capacity = np.array(np.broadcast_to(np.asarray(capacity, dtype=np.float64), (n,)))
+        if np.any(self.rate <= 0):
+            raise ValueError("rate must be > 0")
+        if np.any(self.capacity <= 0):
+            raise ValueError("capacity must be > 0")
+
+        if clock is None:
+            clock, clock_ns = time.monotonic_ns, True
+        self._clock = clock
+        self._coerce = int if clock_ns else float
+        self._tick = 1e-9 if clock_ns else 1.0
+        self.last_ts = np.full(n, self._coerce(self._clock()), dtype=np.int64 if clock_ns else np.float64)
+        self.tokens = self.capacity.copy() if start_full else np.zeros(n)
+
+    def __len__(self) -> int:
+        return self.tokens.size
+
+    def snapshot(self, bucket_id: int) -> TokenBucketSnapshot:
+        return TokenBucketSnapshot(
+            rate=float(self.rate[bucket_id]),
+            capacity=float(self.capacity[bucket_id]),
+            tokens=float(self.tokens[bucket_id]),
+            last_ts=self.last_ts[bucket_id].item(),
+        )
+
+    def allow_many(self, ids, *, cost=1.0, now: Optional[Union[float, int]] = None) -> "np.ndarray":
+        """
+        Refill and try to consume `cost` from each bucket in `ids`.
+
+        cost: scalar or one value per id. Returns a bool array aligned with ids.
+        ids must be in range(n) and unique within a batch (each bucket is updated once).
+        """
+        ids = np.asarray(ids, dtype=np.intp)
+        # before any indexing: a negative id would alias another bucket and slip past the unique check
+        if np.any(ids < 0) or np.any(ids >= len(self)):
+            raise ValueError("ids must be in range(n)")
+        cost = np.asarray(cost, dtype=np.float64)
+        capacity = self.capacity[ids]
+        if np.any(cost <= 0):
+            raise ValueError("cost must be > 0")
+        if np.any(cost > capacity):
+            raise ValueError("cost must be <= capacity")
+        if np.unique(ids).size != ids.size:
+            raise ValueError("ids must be unique within a batch")
+
+        t = self._coerce(self._clock() if now is None else now)
+        last_ts = self.last_ts[ids]
+        # backward time counts as no time elapsed (same clamp as TokenBucket._refill);
+        # with an int64 ns clock the subtraction is exact integer math
+        elapsed = np.maximum(np.subtract(t, last_ts), 0)
+        tokens = np.minimum(capacity, self.tokens[ids] + elapsed * (self.rate[ids] * self._tick))
+
+        allowed = tokens >= cost
+        self.tokens[ids] = np.where(allowed, tokens - cost, tokens)
+        self.last_ts[ids] = np.maximum(last_ts, t)
+        return allowed
@@ -1,6 +1,9 @@
+import json
+import sys
 import unittest
+from unittest import mock
 
-from lcrc_ratelimit.cli import build_parser
+from lcrc_ratelimit.cli import _dump_json, _fast_check, build_parser
 
 
 class TestCLI(unittest.TestCase):
@@ -8,3 +11,33 @@ class TestCLI(unittest.TestCase):
         p = build_parser()
         args = p.parse_args(["simulate", "--rate", "1", "--capacity", "2"])
         self.assertEqual(args.cmd, "simulate")
+
+    def test_fast_check_matches_argparse(self):
+        for argv in (
+            ["check", "--rate", "1", "--capacity", "2"],
+            ["check", "--capacity", "5", "--rate", "0.5", "--cost", "2", "--json", "--start-full"],
+        ):
+            with self.subTest(argv=argv):
+                self.assertEqual(vars(_fast_check(argv)), vars(build_parser().parse_args(argv)))
+
+    def test_fast_check_defers_to_argparse(self):
+        for argv in (
+            [],
+            ["simulate", "--rate", "1", "--capacity", "2"],
+            ["check", "--rate", "1"],
+            ["check", "--rate", "x", "--capacity", "2"],
+            ["check", "--rate=1", "--capacity", "2"],
+            ["check", "--help"],
+        ):
+            with self.subTest(argv=argv):
+                self.assertIsNone(_fast_check(argv))
+
+    def test_dump_json_pretty_and_compact(self):
+        obj = {"a": [1, 2.5, None], "b": {"c": True}}
+        # None in sys.modules makes `import orjson` fail: exercises the stdlib fallback too
+        for mods in ({}, {"orjson": None}):
+            with self.subTest(orjson=not mods), mock.patch.dict(sys.modules, mods):
+                self.assertEqual(_dump_json(obj, pretty=True), json.dumps(obj, indent=2).encode())
+                self.assertEqual(_dump_json(obj, pretty=False), b'{"a":[1,2.5,null],"b":{"c":true}}')
+                # beyond orjson's 64-bit ints (e.g. a huge --n echoed in simulate's params): stdlib fallback
+                self.assertEqual(_dump_json({"n": 2**70}, pretty=False), b'{"n":1180591620717411303424}')
@@ -1,5 +1,9 @@
 import unittest
 
+from unittest import mock
+
+from lcrc_ratelimit import limiter
+from lcrc_ratelimit._fastmath import HAVE_NUMBA, compiled_refill_and_take
 from lcrc_ratelimit.limiter import TokenBucket
 
 
@@ -14,6 +18,17 @@ class FakeClock:
         self.t += float(dt)
 
 
+class FakeClockNs:
+    def __init__(self, start: int = 0) -> None:
+        self.t = int(start)
+
+    def now(self) -> int:
+        return self.t
+
+    def advance(self, dt: float) -> None:
+        self.t += int(dt * 1_000_000_000)
+
+
 class TestTokenBucket(unittest.TestCase):
     def test_starts_full_allows_burst(self):
         c = FakeClock()
@@ -51,6 +66,22 @@ class TestTokenBucket(unittest.TestCase):
         self.assertEqual(b.wait_time(cost=1.0), 0.0)
         self.assertTrue(b.allow(cost=1.0))
 
+    def test_ns_clock_refills_in_seconds(self):
+        c = FakeClockNs(5_000_000_000)
+        b = TokenBucket(rate=2.0, capacity=4.0, clock=c.now, clock_ns=True, start_full=False)
+
+        self.assertFalse(b.allow(cost=1.0))
+        c.advance(0.5)  # +1 token
+        self.assertTrue(b.allow(cost=1.0))
+        self.assertFalse(b.allow(cost=1.0))
+        self.assertEqual(b.snapshot().last_ts, 5_500_000_000)
+        self.assertAlmostEqual(b.wait_time(cost=1.0), 0.5)
+
+    def test_default_clock_is_monotonic_ns(self):
+        b = TokenBucket(rate=1.0, capacity=2.0)
+        self.assertIsInstance(b.snapshot().last_ts, int)
+        self.assertTrue(b.allow(cost=1.0))
+
     def test_invalid_params(self):
         c = FakeClock()
         with self.assertRaises(ValueError):
@@ -64,6 +95,37 @@ class TestTokenBucket(unittest.TestCase):
         with self.assertRaises(ValueError):
             b.allow(cost=2.0)  # cost > capacity
 
+    @unittest.skipUnless(HAVE_NUMBA, "numba not installed")
+    def test_jit_matches_python_path(self):
+        c = FakeClock()
+        py = TokenBucket(rate=3.0, capacity=4.0, clock=c.now, start_full=False)
+        jit = TokenBucket(rate=3.0, capacity=4.0, clock=c.now, start_full=False, jit=True)
+
+        for dt in (0.0, 0.1, 0.5, 0.0, 2.0, -1.0, 0.25, 0.3):
+            c.advance(dt)
+            self.assertEqual(jit.allow(cost=1.0), py.allow(cost=1.0))
+            self.assertEqual(jit.snapshot(), py.snapshot())
+
+    @unittest.skipIf(compiled_refill_and_take is None, "C extension not built")
+    def test_compiled_kernel_matches_python_path(self):
+        for clock_cls, clock_ns in ((FakeClock, False), (FakeClockNs, True)):
+            with self.subTest(clock_ns=clock_ns):
+                c = clock_cls()
+                compiled = TokenBucket(rate=3.0, capacity=4.0, clock=c.now, clock_ns=clock_ns, start_full=False)
+                with mock.patch.object(limiter, "compiled_refill_and_take", None):
+                    py = TokenBucket(rate=3.0, capacity=4.0, clock=c.now, clock_ns=clock_ns, start_full=False)
+
+                for dt in (0.0, 0.1, 0.5, 0.0, 2.0, -1.0, 0.25, 0.3):
+                    c.advance(dt)
+                    self.assertEqual(compiled.allow(cost=1.0), py.allow(cost=1.0))
+                    self.assertEqual(compiled.snapshot(), py.snapshot())
+
+    @unittest.skipIf(HAVE_NUMBA, "numba is installed")
+    def test_jit_requires_numba(self):
+        c = FakeClock()
+        with self.assertRaises(ImportError):
+            TokenBucket(rate=1.0, capacity=1.0, clock=c.now, jit=True)
+
     def test_clock_backwards_is_clamped(self):
         # ensure no negative refill weirdness
         class WeirdClock:
@@ -73,7 +135,12 @@ class TestTokenBucket(unittest.TestCase):
                 self.t -= 1.0
                 return self.t
 
-        wc = WeirdClock()
-        b = TokenBucket(rate=1.0, capacity=1.0, clock=wc.now, start_full=False)
-        # should not crash, should be stable
-        self.assertFalse(b.allow(cost=1.0))
+        for monotonic_clock in (True, False):
+            with self.subTest(monotonic_clock=monotonic_clock):
+                wc = WeirdClock()
+                b = TokenBucket(
+                    rate=1.0, capacity=1.0, clock=wc.now, start_full=False, monotonic_clock=monotonic_clock
+                )
+                # should not crash, should be stable
+                self.assertFalse(b.allow(cost=1.0))
+                self.assertEqual(b.snapshot().last_ts, 9.0)
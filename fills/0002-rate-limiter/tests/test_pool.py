@@ -0,0 +1,93 @@
+import unittest
+
+from lcrc_ratelimit.limiter import TokenBucket
+from lcrc_ratelimit.pool import BucketPool
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class FakeClock:
+    def __init__(self, start: float = 0.0) -> None:
+        self.t = float(start)
+
+    def now(self) -> float:
+        return self.t
+
+    def advance(self, dt: float) -> None:
+        self.t += float(dt)
+
+
+class FakeClockNs:
+    def __init__(self, start: int = 0) -> None:
+        self.t = int(start)
+
+    def now(self) -> int:
+        return self.t
+
+    def advance(self, dt: float) -> None:
+        self.t += int(dt * 1_000_000_000)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestBucketPool(unittest.TestCase):
+    def test_matches_token_bucket(self):
+        rates = [1.0, 2.0, 0.5]
+        caps = [3.0, 1.0, 2.0]
+        for clock_cls, clock_ns in ((FakeClock, False), (FakeClockNs, True)):
+            with self.subTest(clock_ns=clock_ns):
+                c = clock_cls()
+                pool = BucketPool(3, rate=rates, capacity=caps, clock=c.now, clock_ns=clock_ns, start_full=False)
+                buckets = [
+                    TokenBucket(rate=r, capacity=cap, clock=c.now, clock_ns=clock_ns, start_full=False)
+                    for r, cap in zip(rates, caps)
+                ]
+
+                for dt, ids in [(0.0, [0, 1, 2]), (0.6, [1, 0]), (1.5, [2, 1, 0]), (-0.5, [0]), (0.7, [0, 2])]:
+                    c.advance(dt)
+                    got = pool.allow_many(ids, cost=1.0)
+                    self.assertEqual(got.tolist(), [buckets[i].allow(cost=1.0) for i in ids])
+                    for i in range(3):
+                        self.assertEqual(pool.snapshot(i), buckets[i].snapshot())
+
+    def test_default_clock_is_int64_ns(self):
+        pool = BucketPool(2, rate=1.0, capacity=1.0)
+        self.assertEqual(pool.last_ts.dtype, np.int64)
+        self.assertEqual(pool.allow_many([0, 1]).tolist(), [True, True])
+
+    def test_per_id_cost(self):
+        c = FakeClock()
+        pool = BucketPool(2, rate=1.0, capacity=4.0, clock=c.now)
+        self.assertEqual(pool.allow_many([0, 1], cost=[4.0, 1.0]).tolist(), [True, True])
+        self.assertEqual(pool.tokens.tolist(), [0.0, 3.0])
+
+    def test_invalid_params(self):
+        c = FakeClock()
+        with self.assertRaises(ValueError):
+            BucketPool(0, rate=1.0, capacity=1.0, clock=c.now)
+        with self.assertRaises(ValueError):
+            BucketPool(2, rate=[1.0, 0.0], capacity=1.0, clock=c.now)
+
+        pool = BucketPool(2, rate=1.0, capacity=1.0, clock=c.now)
+        with self.assertRaises(ValueError):
+            pool.allow_many([0], cost=0.0)
+        with self.assertRaises(ValueError):
+            pool.allow_many([0], cost=2.0)  # cost > capacity
+        with self.assertRaises(ValueError):
+            pool.allow_many([1, 1])
+
+    def test_out_of_range_ids_rejected(self):
+        c = FakeClock()
+        pool = BucketPool(3, rate=1.0, capacity=1.0, clock=c.now)
+        # -1 would alias bucket 2: one token for two admissions
+        for ids in ([-1, 2], [3], [0, -4]):
+            with self.subTest(ids=ids):
+                with self.assertRaises(ValueError):
+                    pool.allow_many(ids)
+        self.assertEqual(pool.tokens.tolist(), [1.0, 1.0, 1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
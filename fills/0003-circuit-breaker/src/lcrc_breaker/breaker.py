@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import math
+import threading
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Callable, Generic, Optional, TypeVar
+from typing import Callable, Generic, Optional, TypeVar, Union
 
 T = TypeVar("T")
 
@@ -17,12 +20,14 @@ class CircuitOpenError(RuntimeError):
     """Raised when a call is rejected while the circuit is OPEN."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Snapshot:
     state: BreakerState
     failures: int
     successes: int
-    open_until: float
+    open_until: Union[float, int]  # clock units: float seconds, or int nanoseconds with clock_ns
+    opens: int = 0  # transitions into OPEN so far
+    closes: int = 0  # HALF_OPEN -> CLOSED transitions so far
 
 
 class CircuitBreaker(Generic[T]):
@@ -35,8 +40,14 @@ class CircuitBreaker(Generic[T]):
       - HALF_OPEN: probing. successes increment. On success_threshold -> CLOSED.
                   Any failure -> OPEN.
 
-    clock: injected time source (float seconds).
+    clock: injected time source (default: time.monotonic_ns); float seconds
+    clock_ns: clock returns integer nanoseconds (implied for the default clock);
+        cooldown is converted to ns once, so the OPEN check is exact int math
     Backward time is clamped (treated as no time elapsed).
+
+    Thread-safe: state reads and transitions happen under an internal lock;
+    fn itself runs outside it. An outcome that arrives while OPEN (the call
+    was admitted before another thread tripped the breaker) is ignored.
     """
 
     def __init__(
@@ -46,6 +57,7 @@ class CircuitBreaker(Generic[T]):
         success_threshold: int = 2,
         cooldown: float = 5.0,
         clock: Optional[Callable[[], float]] = None,
+        clock_ns: bool = False,
     ) -> None:
         if failure_threshold <= 0:
             raise ValueError("failure_threshold must be > 0")
@@ -57,16 +69,26 @@ class CircuitBreaker(Generic[T]):
         self._failure_threshold = int(failure_threshold)
         self._success_threshold = int(success_threshold)
         self._cooldown = float(cooldown)
-        self._clock = clock or (lambda: 0.0)
+        if clock is None:
+            clock, clock_ns = time.monotonic_ns, True
+        self._clock = clock
+        self._coerce = int if clock_ns else float
+        # cooldown in clock units: open_until is computed and compared in the clock's own type
+        ticks = self._cooldown * 1e9 if clock_ns else self._cooldown
+        # inf (or a cooldown that overflows to it) stays float: round() would raise, int + inf compares fine
+        self._cooldown_ticks = round(ticks) if clock_ns and math.isfinite(ticks) else ticks
 
         self._state: BreakerState = BreakerState.CLOSED
         self._failures: int = 0
         self._successes: int = 0
-        self._open_until: float = 0.0
-        self._last_t: float = self._clock()
-
-    def _now(self) -> float:
-        t = float(self._clock())
+        self._open_until: Union[float, int] = self._coerce(0)
+        self._last_t: Union[float, int] = self._coerce(self._clock())
+        self._opens: int = 0
+        self._closes: int = 0
+        self._lock = threading.Lock()
+
+    def _now(self) -> Union[float, int]:
+        t = self._coerce(self._clock())
         # Clamp backward time
         if t < self._last_t:
             t = self._last_t
@@ -74,18 +96,22 @@ class CircuitBreaker(Generic[T]):
         return t
 
     def state(self) -> BreakerState:
-        # Lazily advance OPEN -> HALF_OPEN if cooldown expired
-        self._maybe_transition_on_time()
-        return self._state
+        with self._lock:
+            # Lazily advance OPEN -> HALF_OPEN if cooldown expired
+            self._maybe_transition_on_time()
+            return self._state
 
     def snapshot(self) -> Snapshot:
-        self._maybe_transition_on_time()
-        return Snapshot(
-            state=self._state,
-            failures=self._failures,
-            successes=self._successes,
-            open_until=self._open_until,
-        )
+        with self._lock:
+            self._maybe_transition_on_time()
+            return Snapshot(
+                state=self._state,
+                failures=self._failures,
+                successes=self._successes,
+                open_until=self._open_until,
+                opens=self._opens,
+                closes=self._closes,
+            )
 
     def _maybe_transition_on_time(self) -> None:
         if self._state != BreakerState.OPEN:
@@ -103,21 +129,24 @@ class CircuitBreaker(Generic[T]):
         Admission check without executing any function.
         Returns True if a call would be attempted right now.
         """
-        self._maybe_transition_on_time()
-        return self._state != BreakerState.OPEN
+        with self._lock:
+            self._maybe_transition_on_time()
+            return self._state != BreakerState.OPEN
 
     def _trip_open(self) -> None:
         now = self._now()
         self._state = BreakerState.OPEN
-        self._open_until = now + self._cooldown
+        self._open_until = now + self._cooldown_ticks
         self._failures = 0
         self._successes = 0
+        self._opens += 1
 
     def _close(self) -> None:
         self._state = BreakerState.CLOSED
         self._failures = 0
         self._successes = 0
-        self._open_until = 0.0
+        self._open_until = self._coerce(0)
+        self._closes += 1
 
     def call(self, fn: Callable[[], T]) -> T:
         """
@@ -125,18 +154,20 @@ class CircuitBreaker(Generic[T]):
 
         Raises CircuitOpenError if OPEN and cooldown not expired.
         """
-        self._maybe_transition_on_time()
-
-        if self._state == BreakerState.OPEN:
-            raise CircuitOpenError("circuit is open")
+        with self._lock:
+            self._maybe_transition_on_time()
+            if self._state == BreakerState.OPEN:
+                raise CircuitOpenError("circuit is open")
 
         try:
             result = fn()
         except Exception:
-            self._on_failure()
+            with self._lock:
+                self._on_failure()
             raise
         else:
-            self._on_success()
+            with self._lock:
+                self._on_success()
             return result
 
     def _on_failure(self) -> None:
@@ -146,13 +177,10 @@ class CircuitBreaker(Generic[T]):
                 self._trip_open()
             return
 
-        # HALF_OPEN: any failure reopens immediately
+        # HALF_OPEN: any failure reopens immediately.
+        # OPEN: late failure of a call admitted before another thread tripped; already open.
         if self._state == BreakerState.HALF_OPEN:
             self._trip_open()
-            return
-
-        # OPEN failures do not occur (calls are blocked), defensive:
-        self._trip_open()
 
     def _on_success(self) -> None:
         if self._state == BreakerState.CLOSED:
@@ -160,11 +188,8 @@ class CircuitBreaker(Generic[T]):
             self._failures = 0
             return
 
+        # OPEN: late success of a call admitted before the trip; must not close the breaker.
         if self._state == BreakerState.HALF_OPEN:
             self._successes += 1
             if self._successes >= self._success_threshold:
                 self._close()
-            return
-
-        # OPEN success does not occur, defensive:
-        self._close()
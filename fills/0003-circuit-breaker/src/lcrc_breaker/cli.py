@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import argparse
-import json
-from dataclasses import asdict, dataclass
+import sys
+from dataclasses import dataclass
 from typing import List, Optional
 
 from .breaker import CircuitBreaker, CircuitOpenError
@@ -50,15 +50,41 @@ def build_parser() -> argparse.ArgumentParser:
         help="Comma-separated steps: ok,fail,call,wait:SECONDS",
     )
     s_sim.add_argument("--json", action="store_true", help="Output JSON")
+    s_sim.add_argument("--compact", action="store_true", help="With --json: single-line output")
 
     s_call = sub.add_parser("call", parents=[common], help="Single call attempt (ok/fail).")
     s_call.add_argument("--ok", action="store_true", help="Call succeeds")
     s_call.add_argument("--fail", action="store_true", help="Call raises an exception")
     s_call.add_argument("--json", action="store_true", help="Output JSON")
+    s_call.add_argument("--compact", action="store_true", help="With --json: single-line output")
 
     return p
 
 
+def _dump_json(obj, pretty: bool) -> bytes:
+    """Snapshot / step results as JSON bytes: orjson for --compact when installed and able, else stdlib."""
+    if not pretty:
+        try:
+            import orjson
+
+            return orjson.dumps(obj)
+        except (ImportError, TypeError):
+            pass
+    import json
+
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _ok_fn() -> str:
+    return "ok"
+
+
+def _fail_fn() -> str:
+    raise RuntimeError("simulated failure")
+
+
 def _make_breaker(args, clock: ManualClock) -> CircuitBreaker:
     return CircuitBreaker(
         failure_threshold=args.failure_threshold,
@@ -78,6 +104,21 @@ def _snap(b: CircuitBreaker) -> dict:
     }
 
 
+def _step_dict(r: StepResult) -> dict:
+    # asdict(r) without the recursive copy
+    return {
+        "i": r.i,
+        "t": r.t,
+        "action": r.action,
+        "allowed": r.allowed,
+        "state": r.state,
+        "failures": r.failures,
+        "successes": r.successes,
+        "open_until": r.open_until,
+        "outcome": r.outcome,
+    }
+
+
 def simulate(args) -> int:
     clock = ManualClock(0.0)
     b = _make_breaker(args, clock)
@@ -85,12 +126,6 @@ def simulate(args) -> int:
     seq = [x.strip() for x in args.seq.split(",") if x.strip()]
     results: List[StepResult] = []
 
-    def ok_fn():
-        return "ok"
-
-    def fail_fn():
-        raise RuntimeError("simulated failure")
-
     for i, token in enumerate(seq):
         action = token
         if token.startswith("wait:"):
@@ -119,14 +154,14 @@ def simulate(args) -> int:
 
         if token == "ok":
             try:
-                b.call(ok_fn)
+                b.call(_ok_fn)
                 outcome = "ok"
             except CircuitOpenError:
                 outcome = "open"
             snap = _snap(b)
         elif token == "fail":
             try:
-                b.call(fail_fn)
+                b.call(_fail_fn)
                 outcome = "fail"
             except CircuitOpenError:
                 outcome = "open"
@@ -136,7 +171,7 @@ def simulate(args) -> int:
         elif token == "call":
             # "call" means attempt a no-op ok call, useful to see OPEN behavior
             try:
-                b.call(ok_fn)
+                b.call(_ok_fn)
                 outcome = "ok"
             except CircuitOpenError:
                 outcome = "open"
@@ -167,9 +202,9 @@ def simulate(args) -> int:
                 "dt": args.dt,
                 "seq": args.seq,
             },
-            "results": [asdict(r) for r in results],
+            "results": [_step_dict(r) for r in results],
         }
-        print(json.dumps(payload, indent=2))
+        sys.stdout.buffer.write(_dump_json(payload, pretty=not args.compact) + b"\n")
     else:
         for r in results:
             print(
@@ -190,18 +225,12 @@ def single_call(args) -> int:
     clock = ManualClock(0.0)
     b = _make_breaker(args, clock)
 
-    def ok_fn():
-        return "ok"
-
-    def fail_fn():
-        raise RuntimeError("simulated failure")
-
     try:
         if args.ok:
-            b.call(ok_fn)
+            b.call(_ok_fn)
             outcome = "ok"
         else:
-            b.call(fail_fn)
+            b.call(_fail_fn)
             outcome = "fail"
     except CircuitOpenError:
         outcome = "open"
@@ -211,7 +240,7 @@ def single_call(args) -> int:
     snap = _snap(b)
 
     if args.json:
-        print(json.dumps({"outcome": outcome, "snapshot": snap}, indent=2))
+        sys.stdout.buffer.write(_dump_json({"outcome": outcome, "snapshot": snap}, pretty=not args.compact) + b"\n")
     else:
         print(f"outcome={outcome} state={snap['state']} failures={snap['failures']} successes={snap['successes']}")
 
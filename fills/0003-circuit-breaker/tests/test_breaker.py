@@ -1,136 +1,225 @@
+import math
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
 from lcrc_breaker.breaker import CircuitBreaker, CircuitOpenError, BreakerState
 
 
-class FakeClock:
-    def __init__(self, t: float = 0.0) -> None:
-        self.t = float(t)
-
-    def now(self) -> float:
-        return self.t
-
-    def advance(self, dt: float) -> None:
-        self.t += float(dt)
+def FakeClock(t: float = 0.0) -> SimpleNamespace:
+    """Test clock: now() is a bare closure over a one-item list, no instance attribute lookup."""
+    box = [float(t)]
+
+    def advance(dt: float) -> None:
+        box[0] += float(dt)
+
+    def set_(t: float) -> None:
+        box[0] = float(t)
+
+    return SimpleNamespace(now=lambda: box[0], advance=advance, set=set_)
+
+
+def FakeClockNs(t: float = 0.0) -> SimpleNamespace:
+    """FakeClock reading integer nanoseconds; advance()/set() still take seconds."""
+    box = [round(t * 1e9)]
+
+    def advance(dt: float) -> None:
+        box[0] += round(dt * 1e9)
+
+    def set_(t: float) -> None:
+        box[0] = round(t * 1e9)
+
+    return SimpleNamespace(now=lambda: box[0], advance=advance, set=set_)
+
+
+def make_breaker(t0: float = 0.0, clock_ns: bool = False, **params):
+    """(clock, breaker) pair on a fresh FakeClock (or FakeClockNs) starting at t0 seconds."""
+    clock = (FakeClockNs if clock_ns else FakeClock)(t0)
+    return clock, CircuitBreaker(clock=clock.now, clock_ns=clock_ns, **params)
+
+
+def _raise_runtime():
+    raise RuntimeError("x")
+
+
+def _return_ok():
+    return "ok"
+
+
+CLOSED, OPEN, HALF_OPEN = BreakerState.CLOSED, BreakerState.OPEN, BreakerState.HALF_OPEN
+
+
+def expect(**fields):
+    return ("expect", fields)
+
+
+# (name, breaker params + optional clock start "t0", script of (op, arg)):
+#   "fail" / "ok": call a failing / succeeding fn; "open": call is rejected with CircuitOpenError
+#   "advance": move the clock forward; "set": jump the clock to an absolute time
+#   "expect": Snapshot fields to check, all read from a single b.snapshot();
+#             open_until is in seconds (scaled to ns when the scenario runs on FakeClockNs)
+SCENARIOS = [
+    (
+        "closed_to_open_on_failure_threshold",
+        dict(failure_threshold=3, success_threshold=2, cooldown=5.0),
+        [expect(state=CLOSED, failures=0), ("fail", None), expect(state=CLOSED, failures=1),
+         ("fail", None), expect(state=CLOSED, failures=2),
+         ("fail", None), expect(state=OPEN, failures=0, opens=1, open_until=5.0)],
+    ),
+    (
+        "open_is_fail_fast_until_cooldown",
+        dict(failure_threshold=1, success_threshold=1, cooldown=2.0),
+        [("fail", None), expect(state=OPEN, open_until=2.0), ("open", None), ("advance", 1.9), ("open", None),
+         # cooldown expired -> HALF_OPEN, call should be attempted
+         ("advance", 0.2), expect(state=HALF_OPEN, successes=0)],
+    ),
+    (
+        "half_open_success_closes",
+        dict(failure_threshold=1, success_threshold=2, cooldown=1.0),
+        [("fail", None), expect(state=OPEN), ("advance", 1.0), expect(state=HALF_OPEN),
+         ("ok", None), expect(state=HALF_OPEN, successes=1),
+         ("ok", None), expect(state=CLOSED, successes=0, closes=1, open_until=0.0)],
+    ),
+    (
+        "half_open_failure_reopens",
+        dict(failure_threshold=1, success_threshold=2, cooldown=1.0),
+        [("fail", None), expect(state=OPEN), ("advance", 1.0), expect(state=HALF_OPEN),
+         ("fail", None), expect(state=OPEN, opens=2, open_until=2.0)],
+    ),
+    (
+        "success_in_closed_resets_failures",
+        dict(failure_threshold=3, success_threshold=1, cooldown=1.0),
+        [("fail", None), expect(state=CLOSED, failures=1), ("ok", None), expect(state=CLOSED, failures=0)],
+    ),
+    (
+        "clock_backwards_is_clamped",
+        dict(failure_threshold=1, success_threshold=1, cooldown=2.0, t0=10.0),
+        # move time backwards: should still be OPEN (clamped)
+        [("fail", None), expect(state=OPEN, open_until=12.0), ("set", 0.0), ("open", None)],
+    ),
+    (
+        "infinite_cooldown_stays_open",
+        dict(failure_threshold=1, success_threshold=1, cooldown=float("inf")),
+        [("fail", None), expect(state=OPEN, open_until=float("inf")), ("advance", 1e6), ("open", None)],
+    ),
+    (
+        # 1e300 s is finite, but overflows to inf once scaled to ns
+        "huge_cooldown_stays_open",
+        dict(failure_threshold=1, success_threshold=1, cooldown=1e300),
+        [("fail", None), expect(state=OPEN, open_until=1e300), ("advance", 1e6), ("open", None)],
+    ),
+]
 
 
 class TestCircuitBreaker(unittest.TestCase):
     def test_invalid_params(self):
-        with self.assertRaises(ValueError):
-            CircuitBreaker(failure_threshold=0)
-        with self.assertRaises(ValueError):
-            CircuitBreaker(success_threshold=0)
-        with self.assertRaises(ValueError):
-            CircuitBreaker(cooldown=-1)
-
-    def test_closed_to_open_on_failure_threshold(self):
-        clock = FakeClock(0.0)
-        b = CircuitBreaker(failure_threshold=3, success_threshold=2, cooldown=5.0, clock=clock.now)
-
-        def fail():
-            raise RuntimeError("x")
-
-        self.assertEqual(b.state(), BreakerState.CLOSED)
-
-        for _ in range(2):
-            with self.assertRaises(RuntimeError):
-                b.call(fail)
-            self.assertEqual(b.state(), BreakerState.CLOSED)
-
-        with self.assertRaises(RuntimeError):
-            b.call(fail)
-        self.assertEqual(b.state(), BreakerState.OPEN)
-
-    def test_open_is_fail_fast_until_cooldown(self):
-        clock = FakeClock(0.0)
-        b = CircuitBreaker(failure_threshold=1, success_threshold=1, cooldown=2.0, clock=clock.now)
-
-        def fail():
-            raise RuntimeError("x")
-
-        with self.assertRaises(RuntimeError):
-            b.call(fail)
-        self.assertEqual(b.state(), BreakerState.OPEN)
-
-        with self.assertRaises(CircuitOpenError):
-            b.call(lambda: "ok")
-
-        clock.advance(1.9)
-        with self.assertRaises(CircuitOpenError):
-            b.call(lambda: "ok")
-
-        clock.advance(0.2)
-        # cooldown expired -> HALF_OPEN, call should be attempted
-        self.assertEqual(b.state(), BreakerState.HALF_OPEN)
-
-    def test_half_open_success_closes(self):
-        clock = FakeClock(0.0)
-        b = CircuitBreaker(failure_threshold=1, success_threshold=2, cooldown=1.0, clock=clock.now)
-
-        def fail():
-            raise RuntimeError("x")
-
-        with self.assertRaises(RuntimeError):
-            b.call(fail)
-        self.assertEqual(b.state(), BreakerState.OPEN)
-
+        self.assertRaises(ValueError, CircuitBreaker, failure_threshold=0)
+        self.assertRaises(ValueError, CircuitBreaker, success_threshold=0)
+        self.assertRaises(ValueError, CircuitBreaker, cooldown=-1)
+
+    def _assert(self, b, msg=None, **expected):
+        # one snapshot() (one lock round-trip) for all fields
+        s = b.snapshot()
+        for field, value in expected.items():
+            self.assertEqual(getattr(s, field), value, f"{msg}: {field}" if msg else field)
+
+    def test_scenarios(self):
+        for clock_ns in (False, True):
+            for name, params, script in SCENARIOS:
+                with self.subTest(name=name, clock_ns=clock_ns):
+                    self._run_script(clock_ns, params, script)
+
+    def _run_script(self, clock_ns, params, script):
+        clock, b = make_breaker(clock_ns=clock_ns, **params)
+        for step, (op, arg) in enumerate(script):
+            msg = f"step {step}: {op}"
+            if op == "fail":
+                self.assertRaises(RuntimeError, b.call, _raise_runtime)
+            elif op == "ok":
+                self.assertEqual(b.call(_return_ok), "ok", msg)
+            elif op == "open":
+                self.assertRaises(CircuitOpenError, b.call, _return_ok)
+            elif op == "advance":
+                clock.advance(arg)
+            elif op == "set":
+                clock.set(arg)
+            elif op == "expect":
+                if clock_ns and "open_until" in arg:
+                    ticks = arg["open_until"] * 1e9
+                    arg = {**arg, "open_until": round(ticks) if math.isfinite(ticks) else ticks}
+                self._assert(b, msg, **arg)
+            else:
+                raise AssertionError(f"unknown op {op!r}")
+
+    def test_ns_clock_keeps_int_timestamps(self):
+        clock, b = make_breaker(t0=0.1, clock_ns=True, failure_threshold=1, cooldown=1.9)
+        self.assertRaises(RuntimeError, b.call, _raise_runtime)
+        s = b.snapshot()
+        self.assertIs(type(s.open_until), int)
+        self.assertEqual(s.open_until, 2_000_000_000)
+
+        clock.set(1.999999999)  # 1 ns short of the cooldown: exact int compare, no float rounding
+        self._assert(b, state=OPEN)
+        clock.advance(1e-9)
+        self._assert(b, state=HALF_OPEN)
+
+    def test_default_clock_is_monotonic_ns(self):
+        b = CircuitBreaker(failure_threshold=1, cooldown=0.0)
+        self.assertRaises(RuntimeError, b.call, _raise_runtime)
+        self.assertIs(type(b.snapshot().open_until), int)
+
+
+class TestConcurrentTransitions(unittest.TestCase):
+    WORKERS = 32
+
+    def _held(self, outcome):
+        """fn for WORKERS concurrent calls: all are admitted, then finish together."""
+        barrier = threading.Barrier(self.WORKERS, timeout=10)
+
+        def fn():
+            barrier.wait()
+            return outcome()
+
+        return fn
+
+    def _run_wave(self, b, fn, n):
+        def attempt(_):
+            try:
+                return b.call(fn)
+            except RuntimeError as e:
+                return type(e)
+
+        with ThreadPoolExecutor(max_workers=self.WORKERS) as pool:
+            return list(pool.map(attempt, range(n)))
+
+    def test_concurrent_failures_open_once(self):
+        _, b = make_breaker(failure_threshold=5, success_threshold=2, cooldown=60.0)
+
+        # 32 calls admitted while CLOSED; 27 of them fail after the 5th failure tripped the breaker
+        results = self._run_wave(b, self._held(_raise_runtime), self.WORKERS)
+        self.assertEqual(results, [RuntimeError] * self.WORKERS)
+        s = b.snapshot()
+        self.assertEqual(s.state, OPEN)
+        # those late failures must not re-trip (or extend the cooldown)
+        self.assertEqual((s.opens, s.open_until), (1, 60.0))
+
+        results = self._run_wave(b, _raise_runtime, 1024)
+        self.assertEqual(results, [CircuitOpenError] * 1024)
+        self.assertEqual(b.snapshot().opens, 1)
+
+    def test_concurrent_half_open_probes_close_once(self):
+        clock, b = make_breaker(failure_threshold=1, success_threshold=4, cooldown=1.0)
+        self.assertRaises(RuntimeError, b.call, _raise_runtime)
         clock.advance(1.0)
-        self.assertEqual(b.state(), BreakerState.HALF_OPEN)
-
-        b.call(lambda: "ok")
-        self.assertEqual(b.state(), BreakerState.HALF_OPEN)
-
-        b.call(lambda: "ok")
-        self.assertEqual(b.state(), BreakerState.CLOSED)
-
-    def test_half_open_failure_reopens(self):
-        clock = FakeClock(0.0)
-        b = CircuitBreaker(failure_threshold=1, success_threshold=2, cooldown=1.0, clock=clock.now)
-
-        def fail():
-            raise RuntimeError("x")
-
-        with self.assertRaises(RuntimeError):
-            b.call(fail)
-        self.assertEqual(b.state(), BreakerState.OPEN)
-
-        clock.advance(1.0)
-        self.assertEqual(b.state(), BreakerState.HALF_OPEN)
-
-        with self.assertRaises(RuntimeError):
-            b.call(fail)
-        self.assertEqual(b.state(), BreakerState.OPEN)
-
-    def test_success_in_closed_resets_failures(self):
-        clock = FakeClock(0.0)
-        b = CircuitBreaker(failure_threshold=3, success_threshold=1, cooldown=1.0, clock=clock.now)
-
-        def fail():
-            raise RuntimeError("x")
-
-        with self.assertRaises(RuntimeError):
-            b.call(fail)
-        self.assertEqual(b.snapshot().failures, 1)
-
-        b.call(lambda: "ok")
-        self.assertEqual(b.snapshot().failures, 0)
-
-    def test_clock_backwards_is_clamped(self):
-        clock = FakeClock(10.0)
-        b = CircuitBreaker(failure_threshold=1, success_threshold=1, cooldown=2.0, clock=clock.now)
-
-        def fail():
-            raise RuntimeError("x")
-
-        with self.assertRaises(RuntimeError):
-            b.call(fail)
-        self.assertEqual(b.state(), BreakerState.OPEN)
-
-        # move time backwards
-        clock.t = 0.0
-        # should still be OPEN (clamped)
-        with self.assertRaises(CircuitOpenError):
-            b.call(lambda: "ok")
+        self.assertEqual(b.state(), HALF_OPEN)
+
+        # 32 probes admitted while HALF_OPEN; the 4th success closes, the rest land in CLOSED
+        results = self._run_wave(b, self._held(_return_ok), self.WORKERS)
+        self.assertEqual(results, ["ok"] * self.WORKERS)
+        s = b.snapshot()
+        self.assertEqual(s.state, CLOSED)
+        self.assertEqual((s.opens, s.closes, s.failures), (1, 1, 0))
 
 
 if __name__ == "__main__":
@@ -1,14 +1,44 @@
+import json
+import sys
 import unittest
+from dataclasses import asdict
+from functools import lru_cache
+from unittest import mock
 
-from lcrc_breaker.cli import build_parser
+from lcrc_breaker.cli import StepResult, _dump_json, _step_dict, build_parser
+
+# parse_args() does not mutate the parser, so every test in the module can share one
+parser = lru_cache(maxsize=1)(build_parser)
 
 
 class TestCLI(unittest.TestCase):
     def test_parser_exists(self):
-        p = build_parser()
-        args = p.parse_args(["simulate", "--seq", "ok,fail,call"])
+        args = parser().parse_args(["simulate", "--seq", "ok,fail,call"])
         self.assertEqual(args.cmd, "simulate")
 
+    def test_call_subcommand(self):
+        args = parser().parse_args(["call", "--fail", "--failure-threshold", "2", "--json", "--compact"])
+        self.assertEqual((args.cmd, args.ok, args.fail), ("call", False, True))
+        self.assertEqual((args.failure_threshold, args.cooldown), (2, 5.0))
+        self.assertTrue(args.json and args.compact)
+
+    def test_step_dict_matches_asdict(self):
+        r = StepResult(i=1, t=0.5, action="fail", allowed=True, state="open", failures=2, successes=0, open_until=5.5)
+        self.assertEqual(list(_step_dict(r).items()), list(asdict(r).items()))
+
+    def test_dump_json_pretty_and_compact(self):
+        obj = {"a": [1, 2.5, None], "b": {"c": True}}
+        # None in sys.modules makes `import orjson` fail: exercises the stdlib fallback too
+        for mods in ({}, {"orjson": None}):
+            with self.subTest(orjson=not mods), mock.patch.dict(sys.modules, mods):
+                self.assertEqual(_dump_json(obj, pretty=True), json.dumps(obj, indent=2).encode())
+                self.assertEqual(_dump_json(obj, pretty=False), b'{"a":[1,2.5,null],"b":{"c":true}}')
+                # beyond orjson's 64-bit ints (e.g. a huge --failure-threshold echoed in params): stdlib fallback
+                self.assertEqual(
+                    _dump_json({"failure_threshold": 2**70}, pretty=False),
+                    b'{"failure_threshold":1180591620717411303424}',
+                )
+
 
 if __name__ == "__main__":
     unittest.main()